@@ -8,3 +8,11 @@ def tests_data_dir() -> Path:
     tests_dir = Path(__file__).parent.resolve()
     tests_data_dir = tests_dir / "data"
     return tests_data_dir
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch) -> Path:
+    """Keep viscm's on-disk caches out of the user's real cache directory."""
+    cache_home = tmp_path / "cache"
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache_home))
+    return cache_home / "viscm"
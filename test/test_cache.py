@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+
+import viscm.gui
+from viscm.gui import sRGB_gamut_patch
+
+
+def _fail_to_convert(start, end):
+    pytest.fail("gamut patch was converted again instead of loaded from cache")
+
+
+def test_gamut_patch_is_cached_on_disk(cache_dir, monkeypatch):
+    sRGB_gamut_patch("CAM02-UCS", resolution=4)
+    (cache_file,) = cache_dir.glob("gamut-patch-*.npy")
+    # 2 values of the fixed channel * 3 faces * 4**2 cells * 4 corners
+    assert np.load(cache_file).shape == (2 * 3 * 4**2 * 4, 3)
+
+    monkeypatch.setattr(viscm.gui, "_cached_converter", _fail_to_convert)
+    sRGB_gamut_patch("CAM02-UCS", resolution=4)
+
+
+def test_gamut_patch_rebuilds_unreadable_cache(cache_dir):
+    sRGB_gamut_patch("CAM02-UCS", resolution=4)
+    (cache_file,) = cache_dir.glob("gamut-patch-*.npy")
+    expected = np.load(cache_file)
+    cache_file.write_bytes(b"not an array")
+
+    sRGB_gamut_patch("CAM02-UCS", resolution=4)
+
+    np.testing.assert_array_equal(np.load(cache_file), expected)
+
+
+def test_text_example_image_is_cached_on_disk(cache_dir, monkeypatch):
+    viscm.gui._example_image.cache_clear()
+    image = viscm.gui._example_image("st-helens_before-modified.txt.gz")
+    (cache_file,) = cache_dir.glob("example-*.npy")
+
+    viscm.gui._example_image.cache_clear()
+    monkeypatch.setattr(np, "loadtxt", lambda *args, **kwargs: pytest.fail())
+    cached_image = viscm.gui._example_image("st-helens_before-modified.txt.gz")
+
+    assert cached_image.dtype == np.float32
+    np.testing.assert_array_equal(cached_image, image)
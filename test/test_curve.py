@@ -0,0 +1,40 @@
+from math import comb
+
+import numpy as np
+import pytest
+
+from viscm.bezierbuilder.curve import bezier, catmul_clark
+
+
+@pytest.fixture
+def points():
+    return np.array([[-2.0, -25.0], [20.0, -21.0], [23.0, 18.0], [5.0, 10.0]])
+
+
+@pytest.mark.filterwarnings("ignore::FutureWarning")
+def test_bezier_matches_bernstein_sum(points):
+    at = np.linspace(0, 1, 11)
+    n = len(points) - 1
+    expected = sum(
+        np.outer(comb(n, k) * at**k * (1 - at) ** (n - k), points[k])
+        for k in range(n + 1)
+    )
+
+    np.testing.assert_allclose(bezier(points, at), expected, atol=1e-12)
+
+
+@pytest.mark.filterwarnings("ignore::FutureWarning")
+def test_bezier_preserves_shape_of_at(points):
+    at = np.linspace(0, 1, 12).reshape(3, 4)
+
+    assert bezier(points, at).shape == (3, 4, 2)
+    np.testing.assert_allclose(bezier(points, 0.0), points[0])
+    np.testing.assert_allclose(bezier(points, 1.0), points[-1])
+
+
+def test_catmul_clark_interpolates_endpoints(points):
+    curve = catmul_clark(points, np.linspace(0, 1, 100))
+
+    assert curve.shape == (100, 2)
+    np.testing.assert_allclose(curve[0], points[0])
+    np.testing.assert_allclose(curve[-1], points[-1])
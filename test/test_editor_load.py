@@ -88,6 +88,45 @@ class TestEditorLoad:
                 # )
 
 
+def test_pyfile_parameters_load_without_running_file(tests_data_dir, monkeypatch):
+    cm = Colormap(None, "Bezier", "buggy-CAM02-UCS")
+    with monkeypatch.context() as m:
+        m.setattr("builtins.exec", lambda *args: pytest.fail("file was run"))
+        cm.load(str(tests_data_dir / "option_d.py"))
+
+    assert cm.can_edit
+    assert set(cm.params) == {"xp", "yp", "min_Jp", "max_Jp"}
+    assert cm.params["min_Jp"] == 18.8671875
+    # The colormap itself still comes from running the file.
+    assert cm.cmap.N == 256
+    assert cm.name.endswith("option_d.py")
+
+
+def test_pending_pyfile_dropped_by_later_load(tests_data_dir):
+    cm = Colormap(None, "Bezier", "buggy-CAM02-UCS")
+    cm.load(str(tests_data_dir / "option_d.py"))
+    cm.load("viscm/examples/sample_linear.jscm")
+
+    assert cm.name == "sample_linear"
+    assert cm.cmap.name == "sample_linear"
+
+
+@pytest.mark.filterwarnings("ignore::RuntimeWarning")
+def test_out_of_gamut_colormap_saves_and_loads(tmp_path):
+    editor = viscm_editor(xp=[-40, 40, 45, 5, -9], yp=[-45, -21, 18, 40, 12])
+    _, oog = editor.cmap_model.get_sRGB(num=256)
+    assert oog.any()
+    path = str(tmp_path / "oog.jscm")
+    editor.save_colormap(path)
+
+    cm = Colormap(None, "CatmulClark", "CAM02-UCS")
+    cm.load(path)
+
+    colors = cm.cmap(np.linspace(0, 1, 256))[:, :3]
+    assert cm.can_edit
+    assert np.all((colors >= 0) & (colors <= 1))
+
+
 # import matplotlib as mpl
 # try:
 #     from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
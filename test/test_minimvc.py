@@ -0,0 +1,55 @@
+from viscm.minimvc import Trigger
+
+
+def test_version_counts_fires():
+    scheduled = []
+    trigger = Trigger(schedule=scheduled.append)
+    assert trigger.version == 0
+
+    trigger.fire()
+    trigger.fire()
+    assert trigger.version == 2
+
+    # Running the merged callbacks doesn't count as another change.
+    scheduled.pop()()
+    assert trigger.version == 2
+
+
+def test_scheduled_fires_are_merged():
+    scheduled = []
+    trigger = Trigger(schedule=scheduled.append)
+    calls = []
+    trigger.add_callback(lambda: calls.append(None))
+    calls.clear()
+
+    trigger.fire()
+    trigger.fire()
+    assert calls == []
+    assert len(scheduled) == 1
+
+    scheduled.pop()()
+    assert len(calls) == 1
+
+    trigger.fire()
+    assert len(scheduled) == 1
+
+
+def test_bound_method_callbacks_do_not_keep_views_alive():
+    class View:
+        def __init__(self, calls):
+            self.calls = calls
+
+        def refresh(self):
+            self.calls.append(None)
+
+    trigger = Trigger()
+    calls = []
+    view = View(calls)
+    trigger.add_callback(view.refresh)
+    trigger.fire()
+    assert len(calls) == 2
+
+    del view
+    trigger.fire()
+    assert len(calls) == 2
+    assert not trigger._callbacks
@@ -25,6 +25,8 @@ NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
 SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 """
 
+import functools
+
 import numpy as np
 from matplotlib.backends.qt_compat import QtCore  # type: ignore[attr-defined]
 from matplotlib.lines import Line2D
@@ -35,21 +37,29 @@ from viscm.minimvc import Trigger
 Qt = QtCore.Qt
 
 
+def _as_points(xp, yp):
+    return np.column_stack([xp, yp]).astype(float).reshape((-1, 2))
+
+
 class ControlPointModel:
     def __init__(self, xp, yp, fixed=None):
         # fixed is either None (if no point is fixed) or and index of a fixed
         # point
-        self._xp = list(xp)
-        self._yp = list(yp)
+        self._points = _as_points(xp, yp)
         self._fixed = fixed
         self.trigger = Trigger()
 
     def get_control_points(self):
-        return list(self._xp), list(self._yp), self._fixed
+        return self._points[:, 0].tolist(), self._points[:, 1].tolist(), self._fixed
+
+    def get_control_points_array(self):
+        """Like get_control_points, but with the points as an (N, 2) array
+        instead of separate x and y lists."""
+        # A copy, since move_point updates self._points in place
+        return self._points.copy(), self._fixed
 
     def add_point(self, i, new_x, new_y):
-        self._xp.insert(i, new_x)
-        self._yp.insert(i, new_y)
+        self._points = np.insert(self._points, i, (new_x, new_y), axis=0)
         if self._fixed is not None and i <= self._fixed:
             self._fixed += 1
         self.trigger.fire()
@@ -57,8 +67,7 @@ class ControlPointModel:
     def remove_point(self, i):
         if i == self._fixed:
             return
-        del self._xp[i]
-        del self._yp[i]
+        self._points = np.delete(self._points, i, axis=0)
         if self._fixed is not None and i < self._fixed:
             self._fixed -= 1
         self.trigger.fire()
@@ -66,13 +75,14 @@ class ControlPointModel:
     def move_point(self, i, new_x, new_y):
         if i == self._fixed:
             return
-        self._xp[i] = new_x
-        self._yp[i] = new_y
+        if self._points[i, 0] == new_x and self._points[i, 1] == new_y:
+            # e.g. a click without a drag; nothing to recompute
+            return
+        self._points[i] = new_x, new_y
         self.trigger.fire()
 
     def set_control_points(self, xp, yp, fixed=None):
-        self._xp = list(xp)
-        self._yp = list(yp)
+        self._points = _as_points(xp, yp)
         self._fixed = fixed
         self.trigger.fire()
 
@@ -90,16 +100,32 @@ class ControlPointBuilder:
         self.ax.add_line(self.control_polygon)
 
         # Event handler for mouse clicking
-        self.canvas.mpl_connect("button_press_event", self.on_button_press)
-        self.canvas.mpl_connect("button_release_event", self.on_button_release)
-        self.canvas.mpl_connect("motion_notify_event", self.on_motion_notify)
+        self._cids = [
+            self.canvas.mpl_connect("button_press_event", self.on_button_press),
+            self.canvas.mpl_connect("button_release_event", self.on_button_release),
+            self.canvas.mpl_connect("motion_notify_event", self.on_motion_notify),
+            self.canvas.mpl_connect("draw_event", self.on_draw),
+        ]
 
         self._index = None  # Active vertex
+        self._pending_motion = None  # Latest unprocessed drag position
+        # While dragging a vertex, the control polygon is animated and blitted
+        # over this snapshot of the rest of the axes
+        self._background = None
 
         self.control_point_model.trigger.add_callback(self._refresh)
         self.mode = "move"
         self._refresh()
 
+    def disconnect(self):
+        for cid in self._cids:
+            self.canvas.mpl_disconnect(cid)
+        self._cids = []
+        self.control_point_model.trigger.remove_callback(self._refresh)
+        # Drop any drag position still waiting for its timer
+        self._pending_motion = None
+        self._index = None
+
     def on_button_press(self, event):
         modkey = event.guiEvent.modifiers()
         # Ignore clicks outside axes
@@ -108,6 +134,11 @@ class ControlPointBuilder:
         res, ind = self.control_polygon.contains(event)
         if res and modkey == Qt.KeyboardModifier.NoModifier:
             self._index = ind["ind"][0]
+            if self.canvas.supports_blit:
+                # Take the polygon out of the regular draw; on_draw will grab
+                # a background without it on the next redraw.
+                self.control_polygon.set_animated(True)
+                self.canvas.draw_idle()
         if res and (
             modkey == Qt.KeyboardModifier.ControlModifier or self.mode == "remove"
         ):
@@ -116,42 +147,71 @@ class ControlPointBuilder:
         if modkey == Qt.KeyboardModifier.ShiftModifier or self.mode == "add":
             # Adding a new point. Find the two closest points and insert it in
             # between them.
-            total_squared_dists = []
-            xp, yp, _ = self.control_point_model.get_control_points()
-            for i in range(len(xp) - 1):
-                dist = (event.xdata - xp[i]) ** 2
-                dist += (event.ydata - yp[i]) ** 2
-                dist += (event.xdata - xp[i + 1]) ** 2
-                dist += (event.ydata - yp[i + 1]) ** 2
-                total_squared_dists.append(dist)
-            best = np.argmin(total_squared_dists)
+            points, _ = self.control_point_model.get_control_points_array()
+            squared_dists = np.sum((points - (event.xdata, event.ydata)) ** 2, axis=1)
+            best = np.argmin(squared_dists[:-1] + squared_dists[1:])
 
             self.control_point_model.add_point(best + 1, event.xdata, event.ydata)
 
     def on_button_release(self, event):
         if event.button != 1:
             return
+        self._flush_motion()
         self._index = None
+        if self.control_polygon.get_animated():
+            self.control_polygon.set_animated(False)
+            self._background = None
+            self.canvas.draw_idle()
 
     def on_motion_notify(self, event):
         if event.inaxes != self.ax:
             return
         if self._index is None:
             return
-        x, y = event.xdata, event.ydata
+        # Mice can report motion far more often than we can recompute and
+        # redraw everything, so only act on the latest position, at most
+        # about once per frame.
+        if self._pending_motion is None:
+            QtCore.QTimer.singleShot(16, self._flush_motion)
+        self._pending_motion = (event.xdata, event.ydata)
+
+    def _flush_motion(self):
+        if self._pending_motion is None:
+            return
+        x, y = self._pending_motion
+        self._pending_motion = None
+        if self._index is not None:
+            self.control_point_model.move_point(self._index, x, y)
 
-        self.control_point_model.move_point(self._index, x, y)
+    def on_draw(self, event):
+        if self.control_polygon.get_animated():
+            self._background = self.canvas.copy_from_bbox(self.ax.bbox)
+            self.ax.draw_artist(self.control_polygon)
 
     def _refresh(self):
         xp, yp, _ = self.control_point_model.get_control_points()
         self.control_polygon.set_data(xp, yp)
 
-        self.canvas.draw()
+        if self._background is not None:
+            # Mid-drag: only repaint the polygon
+            self.canvas.restore_region(self._background)
+            self.ax.draw_artist(self.control_polygon)
+            self.canvas.blit(self.ax.bbox)
+        else:
+            self.canvas.draw_idle()
 
 
 ################################################################
 
 
+@functools.lru_cache(maxsize=8)
+def _unit_grid(num):
+    """np.linspace(0, 1, num), shared between calls (so read-only)."""
+    grid = np.linspace(0, 1, num)
+    grid.flags.writeable = False
+    return grid
+
+
 def compute_bezier_points(xp, yp, at, method, grid=256):
     at = np.asarray(at)
     # The Bezier curve is parameterized by a value t which ranges from 0
@@ -159,10 +219,10 @@ def compute_bezier_points(xp, yp, at, method, grid=256):
     # and arclength. We want to parameterize by t', which measures
     # normalized arclength. To do this, we have to calculate the function
     # arclength(t), and then invert it.
-    t = np.linspace(0, 1, grid)
+    t = _unit_grid(grid)
 
-    arclength = compute_arc_length(xp, yp, method, t=t)
-    arclength /= arclength[-1]
+    arclength = _arc_length_lut(tuple(xp), tuple(yp), method, grid)
+    arclength = arclength / arclength[-1]
     # Now (t, arclength) is a lookup table describing the t -> arclength
     # mapping. Invert it to get at -> t
     at_t = np.interp(at, arclength, t)
@@ -170,38 +230,50 @@ def compute_bezier_points(xp, yp, at, method, grid=256):
     # (Might be quicker to np.interp againts x and y, but eh, doesn't
     # really matter.)
 
-    return method(list(zip(xp, yp)), at_t).T
+    return method(np.column_stack([xp, yp]), at_t).T
 
 
 def compute_arc_length(xp, yp, method, t=None, grid=256):
     if t is None:
-        t = np.linspace(0, 1, grid)
-    x, y = method(list(zip(xp, yp)), t).T
-    x_deltas = np.diff(x)
-    y_deltas = np.diff(y)
-    arclength_deltas = np.empty(len(x))
+        t = _unit_grid(grid)
     if t.size == 0:
         return np.asarray([0])
-    arclength_deltas[0] = 0
-    np.hypot(x_deltas, y_deltas, out=arclength_deltas[1:])
-    return np.cumsum(arclength_deltas)
+    deltas = np.diff(method(np.column_stack([xp, yp]), t), axis=0)
+    arclength = np.empty(len(deltas) + 1)
+    arclength[0] = 0
+    np.hypot(deltas[:, 0], deltas[:, 1], out=arclength[1:])
+    # Accumulate in place; the segment lengths aren't needed afterwards
+    return np.cumsum(arclength, out=arclength)
+
+
+# Views refresh on every trigger, and most of them ask for the curve at
+# control points that haven't changed since the last refresh (or that another
+# view just asked about), so remember the last few arclength tables.
+@functools.lru_cache(maxsize=8)
+def _arc_length_lut(xp, yp, method, grid=256):
+    arclength = compute_arc_length(xp, yp, method, grid=grid)
+    # Shared between callers, so make sure nobody modifies it in place
+    arclength.flags.writeable = False
+    return arclength
 
 
 class SingleBezierCurveModel:
     def __init__(self, control_point_model, method="CatmulClark"):
         self.method = curve_method[method]
         self.control_point_model = control_point_model
-        x, y = self.get_bezier_points()
-        self.bezier_curve = Line2D(x, y)
+        # Filled in by _refresh, which add_callback calls straight away
+        self.bezier_curve = Line2D([], [])
         self.trigger = self.control_point_model.trigger
         self.trigger.add_callback(self._refresh)
 
     def get_bezier_points(self, num=200):
-        return self.get_bezier_points_at(np.linspace(0, 1, num))
+        return self.get_bezier_points_at(_unit_grid(num))
 
     def get_bezier_points_at(self, at, grid=1000):
-        xp, yp, _ = self.control_point_model.get_control_points()
-        return compute_bezier_points(xp, yp, at, self.method, grid=grid)
+        points, _ = self.control_point_model.get_control_points_array()
+        return compute_bezier_points(
+            points[:, 0], points[:, 1], at, self.method, grid=grid
+        )
 
     def _refresh(self):
         x, y = self.get_bezier_points()
@@ -213,13 +285,13 @@ class TwoBezierCurveModel:
     def __init__(self, control_point_model, method="CatmulClark"):
         self.method = curve_method[method]
         self.control_point_model = control_point_model
-        x, y = self.get_bezier_points()
-        self.bezier_curve = Line2D(x, y)
+        # Filled in by _refresh, which add_callback calls straight away
+        self.bezier_curve = Line2D([], [])
         self.trigger = self.control_point_model.trigger
         self.trigger.add_callback(self._refresh)
 
     def get_bezier_points(self, num=200):
-        return self.get_bezier_points_at(np.linspace(0, 1, num))
+        return self.get_bezier_points_at(_unit_grid(num))
 
     def get_bezier_points_at(self, at, grid=256):
         at = np.asarray(at)
@@ -229,16 +301,14 @@ class TwoBezierCurveModel:
         low_mask = at < 0.5
         high_mask = at >= 0.5
 
-        xp, yp, fixed = self.control_point_model.get_control_points()
+        points, fixed = self.control_point_model.get_control_points_array()
         assert fixed is not None
 
-        low_xp = xp[: fixed + 1]
-        low_yp = yp[: fixed + 1]
-        high_xp = xp[fixed:]
-        high_yp = yp[fixed:]
+        low_xp, low_yp = points[: fixed + 1].T
+        high_xp, high_yp = points[fixed:].T
 
-        low_al = compute_arc_length(low_xp, low_yp, self.method).max()
-        high_al = compute_arc_length(high_xp, high_yp, self.method).max()
+        low_al = _arc_length_lut(tuple(low_xp), tuple(low_yp), self.method).max()
+        high_al = _arc_length_lut(tuple(high_xp), tuple(high_yp), self.method).max()
 
         sf = min(low_al, high_al) / max(low_al, high_al)
 
@@ -271,14 +341,12 @@ class BezierCurveView:
         self.bezier_curve_model = bezier_curve_model
 
         self.canvas = self.ax.figure.canvas
-        x, y = self.bezier_model.get_bezier_points()
-        self.bezier_curve = Line2D(x, y)
+        self.bezier_curve = Line2D([], [])
         self.ax.add_line(self.bezier_curve)
 
         self.bezier_curve_model.trigger.add_callback(self._refresh)
-        self._refresh()
 
     def _refresh(self):
         x, y = self.bezier_curve_model.get_bezier_points()
         self.bezier_curve.set_data(x, y)
-        self.canvas.draw()
+        self.canvas.draw_idle()
@@ -1,17 +1,6 @@
 import warnings
 
 import numpy as np
-from scipy.special import binom
-
-
-def bernstein(n, k):
-    """Bernstein polynomial."""
-    coeff = binom(n, k)
-
-    def _bpoly(x):
-        return coeff * x**k * (1 - x) ** (n - k)
-
-    return _bpoly
 
 
 def bezier(points, at):
@@ -23,28 +12,54 @@ def bezier(points, at):
     )
 
     at = np.asarray(at)
-    at_flat = at.ravel()
+    points = np.asarray(points, dtype=float)
+    s = at.reshape((-1, 1, 1))
+    b = np.broadcast_to(points, (s.shape[0], *points.shape))
+    # de Casteljau's algorithm, vectorized over all evaluation points: keep
+    # interpolating between neighbouring points until only one is left
+    for k in range(len(points) - 1, 0, -1):
+        b = b[:, :k] * (1 - s) + b[:, 1 : k + 1] * s
+    return b[:, 0].reshape((*at.shape, 2))
+
+
+def _catmul_clark_subdivide(points, target_len):
+    """Subdivide the control polygon until it has at least target_len points."""
     n = len(points)
-    curve = np.zeros((at_flat.shape[0], 2))
-    for ii in range(n):
-        curve += np.outer(bernstein(n - 1, ii)(at_flat), points[ii])
-    return curve.reshape((*at.shape, 2))
+    final_len = n
+    while final_len < target_len:
+        final_len *= 2
+    if final_len == n:
+        return points
+
+    # Every pass doubles the number of points, so we know the final size up
+    # front: ping-pong between two buffers of that size instead of
+    # allocating a new array on each pass.
+    src = np.empty((final_len, 2))
+    dst = np.empty((final_len, 2))
+    src[:n] = points
+    while n < final_len:
+        p = src[:n]
+        new_p = dst[: 2 * n]
+        new_p[0] = p[0]
+        new_p[-1] = p[-1]
+        # Each segment is replaced by the points 1/4 and 3/4 along it
+        near = new_p[1:-2:2]
+        far = new_p[2:-1:2]
+        np.subtract(p[1:], p[:-1], out=near)
+        near *= 0.25
+        np.subtract(p[1:], near, out=far)
+        near += p[:-1]
+        src, dst = dst, src
+        n *= 2
+    return src[:n]
 
 
 def catmul_clark(points, at):
-    points = np.asarray(points)
-
-    while len(points) < len(at):
-        new_p = np.zeros((2 * len(points), 2))
-        new_p[0] = points[0]
-        new_p[-1] = points[-1]
-        new_p[1:-2:2] = 3 / 4.0 * points[:-1] + 1 / 4.0 * points[1:]
-        new_p[2:-1:2] = 1 / 4.0 * points[:-1] + 3 / 4.0 * points[1:]
-        points = new_p
-    xp, yp = zip(*points)
-    xp = np.interp(at, np.linspace(0, 1, len(xp)), xp)
-    yp = np.interp(at, np.linspace(0, 1, len(yp)), yp)
-    return np.asarray(list(zip(xp, yp)))
+    points = _catmul_clark_subdivide(np.asarray(points, dtype=float), len(at))
+    t = np.linspace(0, 1, len(points))
+    xp = np.interp(at, t, points[:, 0])
+    yp = np.interp(at, t, points[:, 1])
+    return np.column_stack([xp, yp])
 
 
 curve_method = {
@@ -1,3 +1,4 @@
+import functools
 import sys
 from pathlib import Path
 
@@ -137,11 +138,13 @@ def _make_window(
         if cm is None:
             raise RuntimeError("Please specify a colormap")
 
+        if save is not None:
+            # Lay the figure out at the saved size from the start
+            fig.set_size_inches(20, 12)
         v = gui.viscm(cm.cmap, name=cm.name, figure=fig, uniform_space=cm.uniform_space)
-        window = gui.ViewerWindow(figure_canvas, v, cm.name)
         if save is not None:
-            v.figure.set_size_inches(20, 12)
             v.figure.savefig(str(save))
+        make_window = functools.partial(gui.ViewerWindow, figure_canvas, v, cm.name)
     elif action == "edit":
         if not cm.can_edit:
             raise RuntimeError("Sorry, I don't know how to edit the specified colormap")
@@ -153,14 +156,16 @@ def _make_window(
             method=cm.method,
             **cm.params,
         )
-        window = gui.EditorWindow(figure_canvas, v)
+        make_window = functools.partial(gui.EditorWindow, figure_canvas, v)
     else:
         raise RuntimeError(
             "Action must be 'edit', 'view', or 'show'. This should never happen.",
         )
 
     if quit_immediately:
+        # No point building a window that will never be shown
         sys.exit()
+    window = make_window()
 
     figure_canvas.setSizePolicy(
         gui.QtWidgets.QSizePolicy.Policy.Expanding,
@@ -6,10 +6,15 @@
 # Simple script using CIECAM02 and CAM02-UCS to visualize properties of a
 # matplotlib colormap
 
+import ast
+import functools
+import hashlib
 import json
 import os.path
 import sys
+import tempfile
 
+import colorspacious
 import matplotlib
 import matplotlib.colors
 import matplotlib.pyplot as plt
@@ -18,8 +23,8 @@ import numpy as np
 from colorspacious import (
     CIECAM02Space,
     CIECAM02Surround,
-    cspace_convert,
     cspace_converter,
+    machado_et_al_2009_matrix,
 )
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 
@@ -63,26 +68,90 @@ buggy_CAM02UCS = {
     "ciecam02_space": buggy_sRGB_viewing_conditions,
 }
 
+
+def _space_key(space):
+    # Dict specs (CVD spaces, buggy_CAM02UCS) aren't hashable, so key them by
+    # their sorted items. Raises TypeError for specs that still can't be hashed.
+    if isinstance(space, dict):
+        space = ("dict", tuple(sorted(space.items())))
+    hash(space)
+    return space
+
+
+def _space_from_key(key):
+    if isinstance(key, tuple) and key[0] == "dict":
+        return dict(key[1])
+    return key
+
+
+@functools.lru_cache(maxsize=32)
+def _converter_for_keys(start_key, end_key):
+    return cspace_converter(_space_from_key(start_key), _space_from_key(end_key))
+
+
+def _cached_converter(start, end):
+    """Like cspace_converter, but reuses converters for repeated space pairs."""
+    try:
+        keys = _space_key(start), _space_key(end)
+    except TypeError:
+        return cspace_converter(start, end)
+    return _converter_for_keys(*keys)
+
+
 GREYSCALE_CONVERSION_SPACE = "JCh"
 
-_sRGB1_to_JCh = cspace_converter("sRGB1", GREYSCALE_CONVERSION_SPACE)
-_JCh_to_sRGB1 = cspace_converter(GREYSCALE_CONVERSION_SPACE, "sRGB1")
+_sRGB1_to_JCh = _cached_converter("sRGB1", GREYSCALE_CONVERSION_SPACE)
+_JCh_to_sRGB1 = _cached_converter(GREYSCALE_CONVERSION_SPACE, "sRGB1")
+
+
+@functools.cache
+def _greyscale_lut(size=4096):
+    # With chroma zeroed, JCh -> sRGB1 depends only on J, so tabulate it once
+    # instead of running the inverse CIECAM02 transform on every call.
+    J = np.linspace(0, 100, size)
+    JCh = np.column_stack([J, np.zeros(size), np.zeros(size)])
+    with np.errstate(invalid="ignore"):
+        sRGB1 = np.clip(_JCh_to_sRGB1(JCh), 0, 1)
+    sRGB1.flags.writeable = False
+    return J, sRGB1
 
 
 def to_greyscale(sRGB1):
-    JCh = _sRGB1_to_JCh(sRGB1)
-    JCh[..., 1] = 0
-    return np.clip(_JCh_to_sRGB1(JCh), 0, 1)
+    J = _sRGB1_to_JCh(sRGB1)[..., 0]
+    lut_J, lut_sRGB1 = _greyscale_lut()
+    grey = np.empty(J.shape + (3,))
+    for channel in range(3):
+        grey[..., channel] = np.interp(J, lut_J, lut_sRGB1[:, channel])
+    return grey
 
 
-_deuter50_space = {"name": "sRGB1+CVD", "cvd_type": "deuteranomaly", "severity": 50}
-_deuter50_to_sRGB1 = cspace_converter(_deuter50_space, "sRGB1")
-_deuter100_space = {"name": "sRGB1+CVD", "cvd_type": "deuteranomaly", "severity": 100}
-_deuter100_to_sRGB1 = cspace_converter(_deuter100_space, "sRGB1")
-_prot50_space = {"name": "sRGB1+CVD", "cvd_type": "protanomaly", "severity": 50}
-_prot50_to_sRGB1 = cspace_converter(_prot50_space, "sRGB1")
-_prot100_space = {"name": "sRGB1+CVD", "cvd_type": "protanomaly", "severity": 100}
-_prot100_to_sRGB1 = cspace_converter(_prot100_space, "sRGB1")
+# Simulating color vision deficiency is a fixed 3x3 matrix in linear sRGB
+# (Machado et al. 2009), so skip colorspacious' sRGB1+CVD path and apply the
+# matrices directly around a single linearization.
+_sRGB1_to_linear = _cached_converter("sRGB1", "sRGB1-linear")
+_linear_to_sRGB1 = _cached_converter("sRGB1-linear", "sRGB1")
+
+
+def _simulate_cvd(sRGB1, matrix):
+    """Convert sRGB1 colors to how they look with a color vision deficiency.
+
+    matrix is a 3x3 Machado matrix, or a stack of them with shape (..., 3, 3)
+    to simulate several deficiencies at once; the result then gets the
+    stack's leading dimensions in front of sRGB1's shape.
+    """
+    linear = _sRGB1_to_linear(sRGB1)
+    return _linear_to_sRGB1(linear @ np.swapaxes(matrix, -1, -2))
+
+
+_deuter50_matrix = machado_et_al_2009_matrix("deuteranomaly", 50)
+_deuter100_matrix = machado_et_al_2009_matrix("deuteranomaly", 100)
+_prot50_matrix = machado_et_al_2009_matrix("protanomaly", 50)
+_prot100_matrix = machado_et_al_2009_matrix("protanomaly", 100)
+
+_deuter50_to_sRGB1 = functools.partial(_simulate_cvd, matrix=_deuter50_matrix)
+_deuter100_to_sRGB1 = functools.partial(_simulate_cvd, matrix=_deuter100_matrix)
+_prot50_to_sRGB1 = functools.partial(_simulate_cvd, matrix=_prot50_matrix)
+_prot100_to_sRGB1 = functools.partial(_simulate_cvd, matrix=_prot100_matrix)
 
 
 def _show_cmap(ax, rgb):
@@ -90,7 +159,9 @@ def _show_cmap(ax, rgb):
 
 
 def _apply_rgb_mat(mat, rgb):
-    return np.clip(np.einsum("...ij,...j->...i", mat, rgb), 0, 1)
+    # rgb holds row vectors, so rgb @ mat.T is mat applied to each color.
+    out = np.asarray(rgb, dtype=float) @ np.asarray(mat, dtype=float).T
+    return np.clip(out, 0, 1, out=out)
 
 
 # sRGB corners: a' goes from -37.4 to 45
@@ -110,72 +181,62 @@ def _setup_Jpapbp_axis(ax):
     ax.set_zlim(*JP_LIM)
 
 
-# Adapt a matplotlib colormap to a linearly transformed version -- useful for
-# visualizing how colormaps look given color deficiency.
-# Kinda a hack, b/c we inherit from Colormap (this is required), but then
-# ignore its implementation entirely. This results in errors at runtime:
-#       File "/<env>/site-packages/matplotlib/artist.py", line 1343, in format_cursor_data  # noqa: E501
-#         n = self.cmap.N
-#             ^^^^^^^^^^^
-#     AttributeError: 'TransformedCMap' object has no attribute 'N'
-class TransformedCMap(matplotlib.colors.Colormap):
-    def __init__(self, transform, base_cmap):
-        self.transform = transform
-        self.base_cmap = base_cmap
+def _transformed_cmap(transform, base_cmap, name):
+    """Sample base_cmap once and push the samples through transform.
 
-    def __call__(self, *args, **kwargs):
-        bts = kwargs.pop("bytes", False)
-        fx = self.base_cmap(*args, bytes=False, **kwargs)
-        tfx = self.transform(fx)
-        if bts:
-            return (tfx * 255).astype("uint8")
-        return tfx
-
-    def set_bad(self, *args, **kwargs):
-        self.base_cmap.set_bad(*args, **kwargs)
-
-    def set_under(self, *args, **kwargs):
-        self.base_cmap.set_under(*args, **kwargs)
+    transform maps an array of sRGB1 colors to another one of the same
+    shape -- useful for visualizing how colormaps look given color
+    deficiency. The result is a plain ListedColormap, so drawing with it is
+    just a table lookup.
+    """
+    RGBA = base_cmap(np.linspace(0, 1, base_cmap.N))
+    extremes = np.array(
+        [base_cmap.get_bad(), base_cmap.get_under(), base_cmap.get_over()]
+    )
+    for colors in RGBA, extremes:
+        colors[:, :3] = np.clip(transform(colors[:, :3]), 0, 1)
+    bad, under, over = extremes
+    return ListedColormap(RGBA, name=name).with_extremes(
+        bad=bad, under=under, over=over
+    )
 
-    def set_over(self, *args, **kwargs):
-        self.base_cmap.set_over(*args, **kwargs)
 
-    def is_gray(self):
-        return False
+# The viewer and editor layouts are fixed, and a GridSpec built without a
+# figure isn't tied to one, so build them once and share them.
+_VIS_GRID = GridSpec(
+    10,
+    4,
+    left=0.02,
+    right=0.98,
+    bottom=0.02,
+    width_ratios=[1] * 4,
+    height_ratios=[1] * 10,
+)
+_VIS_AXES_SPECS = {
+    "cmap": _VIS_GRID[0, 0],
+    "deltas": _VIS_GRID[1:4, 0],
+    "cmap-greyscale": _VIS_GRID[0, 1],
+    "lightness-deltas": _VIS_GRID[1:4, 1],
+    "deuteranomaly": _VIS_GRID[4, 0],
+    "deuteranopia": _VIS_GRID[5, 0],
+    "protanomaly": _VIS_GRID[4, 1],
+    "protanopia": _VIS_GRID[5, 1],
+    # 'lightness': _VIS_GRID[4:6, 1],
+    # 'colourfulness': _VIS_GRID[4:6, 2],
+    # 'hue': _VIS_GRID[4:6, 3],
+    "image0": _VIS_GRID[0:3, 2],
+    "image0-cb": _VIS_GRID[0:3, 3],
+    "image1": _VIS_GRID[3:6, 2],
+    "image1-cb": _VIS_GRID[3:6, 3],
+    "image2": _VIS_GRID[6:8, 2:],
+    "image2-cb": _VIS_GRID[8:, 2:],
+}
+_VIS_GAMUT_SPEC = _VIS_GRID[6:, :2]
 
 
 def _vis_axes(fig):
-    grid = GridSpec(
-        10,
-        4,
-        left=0.02,
-        right=0.98,
-        bottom=0.02,
-        width_ratios=[1] * 4,
-        height_ratios=[1] * 10,
-    )
-    axes = {
-        "cmap": grid[0, 0],
-        "deltas": grid[1:4, 0],
-        "cmap-greyscale": grid[0, 1],
-        "lightness-deltas": grid[1:4, 1],
-        "deuteranomaly": grid[4, 0],
-        "deuteranopia": grid[5, 0],
-        "protanomaly": grid[4, 1],
-        "protanopia": grid[5, 1],
-        # 'lightness': grid[4:6, 1],
-        # 'colourfulness': grid[4:6, 2],
-        # 'hue': grid[4:6, 3],
-        "image0": grid[0:3, 2],
-        "image0-cb": grid[0:3, 3],
-        "image1": grid[3:6, 2],
-        "image1-cb": grid[3:6, 3],
-        "image2": grid[6:8, 2:],
-        "image2-cb": grid[8:, 2:],
-    }
-
-    axes = {key: fig.add_subplot(value) for (key, value) in axes.items()}
-    axes["gamut"] = fig.add_subplot(grid[6:, :2], projection="3d")
+    axes = {key: fig.add_subplot(value) for (key, value) in _VIS_AXES_SPECS.items()}
+    axes["gamut"] = fig.add_subplot(_VIS_GAMUT_SPEC, projection="3d")
     return axes
 
 
@@ -216,7 +277,7 @@ class viscm:
             name = cm.name
         if figure is None:
             figure = plt.figure()
-        self._sRGB1_to_uniform = cspace_converter("sRGB1", uniform_space)
+        self._sRGB1_to_uniform = _cached_converter("sRGB1", uniform_space)
 
         self.figure = figure
         self.figure.suptitle(f"Colormap evaluation: {name}", fontsize=24)
@@ -276,7 +337,7 @@ class viscm:
             return max(np.max(values) * 1.1, 0)
 
         ax = axes["deltas"]
-        local_deltas = np.sqrt(np.sum((Jpapbp[:-1, :] - Jpapbp[1:, :]) ** 2, axis=-1))
+        local_deltas = np.linalg.norm(np.diff(Jpapbp, axis=0), axis=-1)
         local_derivs = N * local_deltas
         ax.plot(x[1:], local_derivs)
         arclength = np.sum(local_deltas)
@@ -304,7 +365,7 @@ class viscm:
 
         ax.plot(x[1:], lightness_derivs)
         title(ax, "Perceptual lightness derivative")
-        lightness_arclength = np.sum(np.abs(lightness_deltas))
+        lightness_arclength = np.linalg.norm(lightness_deltas, ord=1)
         lightness_rmse = np.std(lightness_derivs)
         label(
             ax,
@@ -330,17 +391,27 @@ class viscm:
         # label(ax, "Hue angle (h)")
         # ax.set_ylim(0, 360)
 
-        def anom(ax, converter, name):
-            _show_cmap(ax, np.clip(converter(RGB), 0, 1))
+        def anom(ax, simulated, name):
+            _show_cmap(ax, simulated)
             label(ax, name)
             ax.get_xaxis().set_visible(False)
             ax.get_yaxis().set_visible(False)
 
-        anom(axes["deuteranomaly"], _deuter50_to_sRGB1, "Moderate deuteranomaly")
-        anom(axes["deuteranopia"], _deuter100_to_sRGB1, "Complete deuteranopia")
+        # All four simulations share one linearization of RGB.
+        simulated = _simulate_cvd(
+            RGB,
+            np.stack(
+                [_deuter50_matrix, _deuter100_matrix, _prot50_matrix, _prot100_matrix]
+            ),
+        )
+        np.clip(simulated, 0, 1, out=simulated)
+        deuter50, deuter100, prot50, prot100 = simulated
+
+        anom(axes["deuteranomaly"], deuter50, "Moderate deuteranomaly")
+        anom(axes["deuteranopia"], deuter100, "Complete deuteranopia")
 
-        anom(axes["protanomaly"], _prot50_to_sRGB1, "Moderate protanomaly")
-        anom(axes["protanopia"], _prot100_to_sRGB1, "Complete protanopia")
+        anom(axes["protanomaly"], prot50, "Moderate protanomaly")
+        anom(axes["protanopia"], prot100, "Complete protanopia")
 
         ax = axes["gamut"]
         ax.plot(Jpapbp[:, 1], Jpapbp[:, 2], Jpapbp[:, 0])
@@ -369,11 +440,8 @@ class viscm:
 
         images = []
         image_args = []
-        example_dir = os.path.join(os.path.dirname(__file__), "examples")
 
-        images.append(
-            np.loadtxt(os.path.join(example_dir, "st-helens_before-modified.txt.gz")).T
-        )
+        images.append(_example_image("st-helens_before-modified.txt.gz").T)
         image_args.append({})
 
         # Adapted from
@@ -381,23 +449,17 @@ class viscm:
         dx = dy = 0.05
         y, x = np.mgrid[-5 : 5 + dy : dy, -5 : 10 + dx : dx]
         z = np.sin(x) ** 10 + np.cos(10 + y * x) + np.cos(x) + 0.2 * y + 0.1 * x
-        images.append(z)
+        images.append(z.astype(np.float32))
         image_args.append({})
 
         # Peter Kovesi's colormap test image at
         #   http://peterkovesi.com/projects/colourmaps/colourmaptest.tif
 
-        images.append(np.load(os.path.join(example_dir, "colourmaptest.npy")))
+        images.append(_example_image("colourmaptest.npy"))
 
         image_args.append({})
 
-        def _deuter_transform(RGBA):
-            # clipping, alpha handling
-            RGB = RGBA[..., :3]
-            RGB = np.clip(_deuter50_to_sRGB1(RGB), 0, 1)
-            return np.concatenate((RGB, RGBA[..., 3:]), axis=-1)
-
-        deuter_cm = TransformedCMap(_deuter_transform, cm)
+        deuter_cm = _transformed_cmap(_deuter50_to_sRGB1, cm, f"{cm.name}_deuter")
 
         for i, (image, args) in enumerate(zip(images, image_args)):
             ax = axes["image%i" % (i,)]
@@ -421,50 +483,109 @@ class viscm:
         self.figure.savefig(path)
 
 
+def _cache_dir():
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(cache_home, "viscm")
+
+
+def _load_cached_array(path):
+    """Memory-map a cached .npy file, or return None if it can't be read."""
+    try:
+        return np.load(path, mmap_mode="r")
+    except (OSError, ValueError):
+        return None
+
+
+def _save_cached_array(path, array):
+    """Write array to path as .npy. Caching is best-effort, so failures are
+    ignored; the file is renamed into place so readers never see a partial
+    write."""
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".npy")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.save(f, array)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError:
+        pass
+
+
+def _gamut_patch_cache_path(uniform_space, resolution):
+    if isinstance(uniform_space, dict):
+        space_repr = repr(sorted(uniform_space.items()))
+    else:
+        space_repr = repr(uniform_space)
+    key = f"{colorspacious.__version__}\n{space_repr}\n{resolution}"
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+    return os.path.join(_cache_dir(), f"gamut-patch-{digest}.npy")
+
+
+@functools.cache
+def _example_image(filename):
+    """Load one of the bundled example images as a read-only array.
+
+    Parsing the gzipped text images is slow, so the parsed array is kept as
+    .npy in the cache directory and memory-mapped afterwards. The images are
+    only ever colormapped for display, where float32 is plenty (and
+    matplotlib resamples float32 data in float32).
+    """
+    path = os.path.join(os.path.dirname(__file__), "examples", filename)
+    if filename.endswith(".npy"):
+        return np.load(path, mmap_mode="r")
+    stat = os.stat(path)
+    key = f"{os.path.abspath(path)}\n{stat.st_mtime_ns}\n{stat.st_size}"
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+    cache_path = os.path.join(_cache_dir(), f"example-{digest}.npy")
+    image = _load_cached_array(cache_path)
+    if image is None:
+        image = np.loadtxt(path, dtype=np.float32)
+        _save_cached_array(cache_path, image)
+        image.flags.writeable = False
+    return image
+
+
 def sRGB_gamut_patch(uniform_space, resolution=20):
     step = 1.0 / resolution
-    sRGB_quads = []
-    sRGB_values = []
-    # each entry in 'quads' is a 4x3 array where each row contains the
-    # coordinates of a corner point
+    # Quads are ordered by (fixed, i, j, face) with faces R, G, B, and each
+    # is a 4x3 array where each row contains the coordinates of a corner
+    # point. The face's channel is held at 'fixed'; the other two channels
+    # walk the (i, j) cell's corners.
+    i, j = np.meshgrid(np.arange(resolution), np.arange(resolution), indexing="ij")
+    i = i[..., np.newaxis]
+    j = j[..., np.newaxis]
+    corners_u = (i + np.array([0, 1, 1, 0])) * step
+    corners_v = (j + np.array([0, 0, 1, 1])) * step
+    sRGB_quads = np.empty((2, resolution, resolution, 3, 4, 3))
+    sRGB_values = np.ones((2, resolution, resolution, 3, 4))
     for fixed in 0, 1:
-        for i in range(resolution):
-            for j in range(resolution):
-                # R quad
-                sRGB_quads.append(
-                    [
-                        [fixed, i * step, j * step],
-                        [fixed, (i + 1) * step, j * step],
-                        [fixed, (i + 1) * step, (j + 1) * step],
-                        [fixed, i * step, (j + 1) * step],
-                    ]
-                )
-                sRGB_values.append((fixed, (i + 0.5) * step, (j + 0.5) * step, 1))
-                # G quad
-                sRGB_quads.append(
-                    [
-                        [i * step, fixed, j * step],
-                        [(i + 1) * step, fixed, j * step],
-                        [(i + 1) * step, fixed, (j + 1) * step],
-                        [i * step, fixed, (j + 1) * step],
-                    ]
-                )
-                sRGB_values.append(((i + 0.5) * step, fixed, (j + 0.5) * step, 1))
-                # B quad
-                sRGB_quads.append(
-                    [
-                        [i * step, j * step, fixed],
-                        [(i + 1) * step, j * step, fixed],
-                        [(i + 1) * step, (j + 1) * step, fixed],
-                        [i * step, (j + 1) * step, fixed],
-                    ]
-                )
-                sRGB_values.append(((i + 0.5) * step, (j + 0.5) * step, fixed, 1))
-    sRGB_quads = np.asarray(sRGB_quads)
-    # work around colorspace transform bugginess in handling high-dim
-    # arrays
-    sRGB_quads_2d = sRGB_quads.reshape((-1, 3))
-    Jpapbp_quads_2d = cspace_convert(sRGB_quads_2d, "sRGB1", uniform_space)
+        for face in range(3):
+            u_axis, v_axis = [axis for axis in range(3) if axis != face]
+            quads = sRGB_quads[fixed, :, :, face]
+            quads[..., face] = fixed
+            quads[..., u_axis] = corners_u
+            quads[..., v_axis] = corners_v
+            values = sRGB_values[fixed, :, :, face]
+            values[..., face] = fixed
+            values[..., u_axis] = (i[..., 0] + 0.5) * step
+            values[..., v_axis] = (j[..., 0] + 0.5) * step
+    sRGB_quads = sRGB_quads.reshape((-1, 4, 3))
+    sRGB_values = sRGB_values.reshape((-1, 4))
+    # The conversion only depends on the space and the resolution, so keep
+    # the result on disk and skip it next time.
+    cache_path = _gamut_patch_cache_path(uniform_space, resolution)
+    Jpapbp_quads_2d = _load_cached_array(cache_path)
+    if Jpapbp_quads_2d is None or Jpapbp_quads_2d.shape != (sRGB_quads.size // 3, 3):
+        # work around colorspace transform bugginess in handling high-dim
+        # arrays
+        sRGB_quads_2d = sRGB_quads.reshape((-1, 3))
+        Jpapbp_quads_2d = _cached_converter("sRGB1", uniform_space)(sRGB_quads_2d)
+        _save_cached_array(cache_path, Jpapbp_quads_2d)
     Jpapbp_quads = Jpapbp_quads_2d.reshape((-1, 4, 3))
     gamut_patch = mpl_toolkits.mplot3d.art3d.Poly3DCollection(
         Jpapbp_quads[:, :, [1, 2, 0]]
@@ -477,21 +598,32 @@ def sRGB_gamut_patch(uniform_space, resolution=20):
 def sRGB_gamut_Jp_slice(
     Jp, uniform_space, ap_lim=(-50, 50), bp_lim=(-50, 50), resolution=200
 ):
-    bp_grid, ap_grid = np.mgrid[
-        bp_lim[0] : bp_lim[1] : resolution * 1j, ap_lim[0] : ap_lim[1] : resolution * 1j
-    ]
-    Jp_grid = Jp * np.ones((resolution, resolution))
-    Jpapbp = np.concatenate(
-        (
-            Jp_grid[:, :, np.newaxis],
-            ap_grid[:, :, np.newaxis],
-            bp_grid[:, :, np.newaxis],
-        ),
-        axis=2,
-    )
-    sRGB = cspace_convert(Jpapbp, uniform_space, "sRGB1")
-    sRGBA = np.concatenate((sRGB, np.ones(sRGB.shape[:2] + (1,))), axis=2)
-    sRGBA[np.any((sRGB < 0) | (sRGB > 1), axis=-1)] = [0, 0, 0, 0]
+    # a' varies along rows and b' down columns; broadcasting the 1-D axes
+    # fills the plane without materializing mgrid's full 2-D grids.
+    Jpapbp = np.empty((resolution, resolution, 3))
+    Jpapbp[..., 0] = Jp
+    Jpapbp[..., 1] = np.linspace(ap_lim[0], ap_lim[1], resolution)[np.newaxis, :]
+    Jpapbp[..., 2] = np.linspace(bp_lim[0], bp_lim[1], resolution)[:, np.newaxis]
+    sRGB = _cached_converter(uniform_space, "sRGB1")(Jpapbp)
+    sRGBA = np.empty(sRGB.shape[:2] + (4,))
+    sRGBA[..., :3] = sRGB
+    sRGBA[..., 3] = 1
+    # Build the out-of-gamut mask a channel at a time, so there's no
+    # full-size (resolution, resolution, 3) boolean temporary.
+    oog = np.zeros(sRGB.shape[:2], dtype=bool)
+    for channel in range(3):
+        oog |= sRGB[..., channel] < 0
+        oog |= sRGB[..., channel] > 1
+    sRGBA[oog] = 0
+    return sRGBA
+
+
+@functools.lru_cache(maxsize=64)
+def _cached_Jp_slice(Jp, space_key, ap_lim, bp_lim):
+    # Only displayed, so float32 is plenty and halves what the cache holds.
+    sRGBA = sRGB_gamut_Jp_slice(Jp, _space_from_key(space_key), ap_lim, bp_lim)
+    sRGBA = sRGBA.astype(np.float32)
+    sRGBA.flags.writeable = False
     return sRGBA
 
 
@@ -529,11 +661,12 @@ def draw_sRGB_gamut_Jp_slice(
 #     return sRGB
 
 
-def _viscm_editor_axes(fig):
-    grid = GridSpec(1, 2, width_ratios=[9, 1], height_ratios=[50])
-    axes = {"bezier": grid[0, 0], "cm": grid[0, 1]}
+_EDITOR_GRID = GridSpec(1, 2, width_ratios=[9, 1], height_ratios=[50])
+_EDITOR_AXES_SPECS = {"bezier": _EDITOR_GRID[0, 0], "cm": _EDITOR_GRID[0, 1]}
+
 
-    axes = {key: fig.add_subplot(value) for (key, value) in axes.items()}
+def _viscm_editor_axes(fig):
+    axes = {key: fig.add_subplot(value) for (key, value) in _EDITOR_AXES_SPECS.items()}
     return axes
 
 
@@ -661,14 +794,30 @@ class viscm_editor:
         )
         self.axes = axes
 
+    def disconnect(self):
+        """Detach all the views and builders from their models and the canvas.
+
+        After this, model changes and canvas events no longer do any work on
+        this editor's figure.
+        """
+        self.bezier_builder.disconnect()
+        self.bezier_gamut_viewer.disconnect()
+        self.bezier_highlight_point_view.disconnect()
+        if self.highlight_point_model1 is not None:
+            self.bezier_highlight_point_view1.disconnect()
+        self.cmap_view.disconnect()
+        self.cmap_highlighter.disconnect()
+
     def save_colormap(self, filepath):
         with open(filepath, "w") as f:
             xp, yp, fixed = self.control_point_model.get_control_points()
-            rgb, _ = self.cmap_model.get_sRGB(num=256)
-            hex_blob = ""
-            for color in rgb:
-                for component in color:
-                    hex_blob += "%02x" % (int(round(component * 255)))
+            # Out-of-gamut colors are clipped, as in show_viscm, so the file
+            # can always be loaded again. Points too far out for the
+            # conversion to give any answer (NaN) are saved as black.
+            rgb, _ = self.cmap_model.get_sRGB(num=256, mark_oog=False)
+            np.nan_to_num(rgb, copy=False)
+            rgb255 = np.clip(np.round(rgb * 255), 0, 255).astype(np.uint8)
+            hex_blob = rgb255.tobytes().hex()
             usage_hints = ["red-green-colorblind-safe", "greyscale-safe"]
             if self.cmtype == "diverging":
                 usage_hints.append("diverging")
@@ -725,7 +874,8 @@ class viscm_editor:
             )
 
     def show_viscm(self):
-        cm = ListedColormap(self.cmap_model.get_sRGB(num=256)[0], name=self.name)
+        rgb, _ = self.cmap_model.get_sRGB(num=256, mark_oog=False)
+        cm = ListedColormap(np.clip(rgb, 0, 1, out=rgb), name=self.name)
 
         return cm
 
@@ -739,6 +889,17 @@ class viscm_editor:
         self.cmap_model.set_filter_k(filter_k)
 
 
+def _call_soon(f):
+    """Trigger scheduler: run f on the next pass through the Qt event loop.
+
+    Without a Qt application there's no loop to wait for, so f runs now.
+    """
+    if QtWidgets.QApplication.instance() is None:
+        f()
+    else:
+        QtCore.QTimer.singleShot(0, f)
+
+
 class BezierCMapModel:
     def __init__(
         self, bezier_model, min_Jp, max_Jp, uniform_space, filter_k=100, cmtype="linear"
@@ -748,18 +909,21 @@ class BezierCMapModel:
         self.max_Jp = max_Jp
         self.filter_k = filter_k
         self.cmtype = cmtype
-        self.trigger = Trigger()
-        self.Jp_minmax_trigger = Trigger()
-        self.Jp_minmax_trigger.add_callback(self.trigger.fire)
+        # Everything downstream of the colormap is expensive to refresh, so
+        # merge the fires from one pass of the event loop into one refresh.
+        self.trigger = Trigger(schedule=_call_soon)
         self.filter_k_trigger = Trigger()
         self.filter_k_trigger.add_callback(self.trigger.fire)
-        self.uniform_to_sRGB1 = cspace_converter(uniform_space, "sRGB1")
+        self.uniform_to_sRGB1 = _cached_converter(uniform_space, "sRGB1")
+        # (curve version, num, ap, bp) from the last get_Jpapbp call. Moving
+        # the J' sliders or the smoothness slider doesn't touch the curve.
+        self._ap_bp_cache = None
         self.bezier_model.trigger.add_callback(self.trigger.fire)
 
     def set_Jp_minmax(self, min_Jp, max_Jp):
         self.min_Jp = min_Jp
         self.max_Jp = max_Jp
-        self.Jp_minmax_trigger.fire()
+        self.trigger.fire()
 
     def set_filter_k(self, filter_k):
         self.filter_k = filter_k
@@ -768,33 +932,52 @@ class BezierCMapModel:
     def get_Jpapbp_at_point(self, point):
         from scipy.interpolate import interp1d
 
-        Jp, ap, bp = self.get_Jpapbp()
-        Jp, ap, bp = interp1d(np.linspace(0, 1, Jp.size), np.array([Jp, ap, bp]))(point)
+        Jpapbp = self.get_Jpapbp()
+        Jp, ap, bp = interp1d(np.linspace(0, 1, Jpapbp.shape[-1]), Jpapbp)(point)
         return Jp, ap, bp
 
     def get_Jpapbp(self, num=200):
-        ap, bp = self.bezier_model.get_bezier_points_at(np.linspace(0, 1, num))
+        # Returns a (3, num) array, so it unpacks as Jp, ap, bp. It's the
+        # transpose of a contiguous (num, 3) buffer, which get_sRGB hands to
+        # the converter as is.
+        version = self.bezier_model.trigger.version
+        if self._ap_bp_cache is None or self._ap_bp_cache[:2] != (version, num):
+            ap, bp = self.bezier_model.get_bezier_points_at(np.linspace(0, 1, num))
+            ap.flags.writeable = bp.flags.writeable = False
+            self._ap_bp_cache = (version, num, ap, bp)
+        ap, bp = self._ap_bp_cache[2:]
         at = np.linspace(0, 1, num)
         if self.cmtype == "diverging":
             from scipy.special import erf
 
             at = 1 + 2 * np.cumsum(erf(self.filter_k * (at - 0.5))) / num
-        Jp = (self.max_Jp - self.min_Jp) * at + self.min_Jp
-        return Jp, ap, bp
-
-    def get_sRGB(self, num=200):
-        # Return sRGB and out-of-gamut mask
-        Jp, ap, bp = self.get_Jpapbp(num=num)
-        sRGB = self.uniform_to_sRGB1(np.column_stack((Jp, ap, bp)))
+        Jpapbp = np.empty((num, 3))
+        Jpapbp[:, 0] = (self.max_Jp - self.min_Jp) * at + self.min_Jp
+        Jpapbp[:, 1] = ap
+        Jpapbp[:, 2] = bp
+        return Jpapbp.T
+
+    def get_sRGB(self, num=200, mark_oog=True):
+        # Return sRGB and out-of-gamut mask. Out-of-gamut colors are set to
+        # NaN unless mark_oog is False, in which case they're left as is.
+        sRGB = self.uniform_to_sRGB1(self.get_Jpapbp(num=num).T)
         oog = np.any((sRGB > 1) | (sRGB < 0), axis=-1)
-        sRGB[oog, :] = np.nan
+        if mark_oog:
+            sRGB[oog, :] = np.nan
         return sRGB, oog
 
 
+# RGBA pixels for CMapView's out-of-gamut strip
+_OOG_COLOR = np.array([[[0, 1, 1, 1]]], dtype=np.float32)
+_CLEAR = np.zeros((1, 1, 4), dtype=np.float32)
+
+
 class CMapView:
     def __init__(self, ax, cmap_model):
         self.ax = ax
         self.cmap_model = cmap_model
+        # Reused between refreshes; set_data copies it, so overwriting is safe
+        self._oog_display = None
 
         rgb_display, oog_display = self._drawable_arrays()
         self.image = self.ax.imshow(rgb_display, extent=(0, 0.2, 0, 1), origin="lower")
@@ -805,15 +988,34 @@ class CMapView:
         self.ax.set_ylim(0, 1)
         self.ax.get_xaxis().set_visible(False)
 
+        # The strip is sized to the axes, so redo it when the window resizes
+        self._resize_cid = self.ax.figure.canvas.mpl_connect(
+            "resize_event", self._on_resize
+        )
         self.cmap_model.trigger.add_callback(self._refresh)
 
+    def disconnect(self):
+        self.ax.figure.canvas.mpl_disconnect(self._resize_cid)
+        self.cmap_model.trigger.remove_callback(self._refresh)
+
+    def _on_resize(self, event):
+        self._refresh()
+
     def _drawable_arrays(self):
         rgb, oog = self.cmap_model.get_sRGB()
+        # No point handing imshow more rows than the axes has pixels. Keep a
+        # row flagged if any sample it stands for is out of gamut.
+        height = int(self.ax.bbox.height)
+        if 0 < height < len(rgb) // 2:
+            starts = np.linspace(0, len(rgb), height, endpoint=False).astype(np.intp)
+            rgb = rgb[np.linspace(0, len(rgb) - 1, height).astype(np.intp)]
+            oog = np.logical_or.reduceat(oog, starts)
         rgb_display = rgb[:, np.newaxis, :]
-        oog_display = np.empty((rgb.shape[0], 1, 4))
-        oog_display[...] = [0, 0, 0, 0]
-        oog_display[oog, :, :] = [0, 1, 1, 1]
-        return rgb_display, oog_display
+        if self._oog_display is None or self._oog_display.shape[0] != len(oog):
+            self._oog_display = np.empty((len(oog), 1, 4), dtype=_CLEAR.dtype)
+        np.copyto(self._oog_display, _CLEAR)
+        np.copyto(self._oog_display, _OOG_COLOR, where=oog[:, np.newaxis, np.newaxis])
+        return rgb_display, self._oog_display
 
     def _refresh(self):
         rgb_display, oog_display = self._drawable_arrays()
@@ -825,7 +1027,7 @@ class HighlightPointModel:
     def __init__(self, cmap_model, point):
         self._cmap_model = cmap_model
         self._point = point
-        self.trigger = Trigger()
+        self.trigger = Trigger(schedule=_call_soon)
 
         self._cmap_model.trigger.add_callback(self.trigger.fire)
 
@@ -848,6 +1050,8 @@ class HighlightPointBuilder:
 
         self.canvas = self.ax.figure.canvas
         self._in_drag = False
+        self._last_y = None  # Pixel height of the last drag position acted on
+        self._pending_ydata = None  # Latest unprocessed drag position
 
         self.marker_line_a = self.ax.axhline(
             highlight_point_model_a.get_point(), linewidth=3, color="r"
@@ -857,41 +1061,106 @@ class HighlightPointBuilder:
                 highlight_point_model_b.get_point(), linewidth=3, color="r"
             )
 
-        self.canvas.mpl_connect("button_press_event", self._on_button_press)
-        self.canvas.mpl_connect("motion_notify_event", self._on_motion)
-        self.canvas.mpl_connect("button_release_event", self._on_button_release)
+        self._marker_lines = [self.marker_line_a]
+        if self.highlight_point_model_b:
+            self._marker_lines.append(self.marker_line_b)
+        # While dragging, the marker lines are animated and blitted over this
+        # snapshot of the rest of the axes
+        self._background = None
+
+        self._cids = [
+            self.canvas.mpl_connect("button_press_event", self._on_button_press),
+            self.canvas.mpl_connect("motion_notify_event", self._on_motion),
+            self.canvas.mpl_connect("button_release_event", self._on_button_release),
+            self.canvas.mpl_connect("draw_event", self._on_draw),
+        ]
 
         self.highlight_point_model_a.trigger.add_callback(self._refresh)
         if highlight_point_model_b:
             self.highlight_point_model_a.trigger.add_callback(self._refresh)
 
+    def disconnect(self):
+        for cid in self._cids:
+            self.canvas.mpl_disconnect(cid)
+        self._cids = []
+        self.highlight_point_model_a.trigger.remove_callback(self._refresh)
+        # Drop any drag position still waiting for its timer
+        self._pending_ydata = None
+        self._in_drag = False
+
     def _on_button_press(self, event):
         if event.inaxes != self.ax:
             return
         if event.button != 1:
             return
         self._in_drag = True
-        self.highlight_point_model_a.set_point(event.ydata)
-        if self.highlight_point_model_b:
-            self.highlight_point_model_b.set_point(1 - event.ydata)
+        if self.canvas.supports_blit:
+            # Take the lines out of the regular draw; _on_draw will grab a
+            # background without them on the next redraw.
+            for line in self._marker_lines:
+                line.set_animated(True)
+            self.canvas.draw_idle()
+        self._last_y = event.y
+        self._set_points(event.ydata)
 
     def _on_motion(self, event):
-        if self._in_drag and event.ydata is not None:
-            self.highlight_point_model_a.set_point(event.ydata)
-            if self.highlight_point_model_b:
-                self.highlight_point_model_b.set_point(1 - event.ydata)
+        if not self._in_drag or event.ydata is None:
+            return
+        # Moves of less than a pixel can't change what's drawn, and mice
+        # report motion far more often than we can redraw, so only act on
+        # the latest position, at most about once per frame.
+        if self._last_y is not None and abs(event.y - self._last_y) < 1:
+            return
+        self._last_y = event.y
+        if self._pending_ydata is None:
+            QtCore.QTimer.singleShot(16, self._flush_motion)
+        self._pending_ydata = event.ydata
+
+    def _flush_motion(self):
+        if self._pending_ydata is None:
+            return
+        ydata = self._pending_ydata
+        self._pending_ydata = None
+        if self._in_drag:
+            self._set_points(ydata)
+
+    def _set_points(self, ydata):
+        self.highlight_point_model_a.set_point(ydata)
+        if self.highlight_point_model_b:
+            self.highlight_point_model_b.set_point(1 - ydata)
 
     def _on_button_release(self, event):
         if event.button != 1:
             return
+        self._flush_motion()
         self._in_drag = False
+        self._last_y = None
+        if self.marker_line_a.get_animated():
+            for line in self._marker_lines:
+                line.set_animated(False)
+            self._background = None
+            self.canvas.draw_idle()
+
+    def _on_draw(self, event):
+        if self.marker_line_a.get_animated():
+            self._background = self.canvas.copy_from_bbox(self.ax.bbox)
+            for line in self._marker_lines:
+                self.ax.draw_artist(line)
 
     def _refresh(self):
         point = self.highlight_point_model_a.get_point()
         self.marker_line_a.set_data([0, 1], [point, point])
         if self.highlight_point_model_b:
             self.marker_line_b.set_data([0, 1], [1 - point, 1 - point])
-        self.canvas.draw()
+
+        if self._background is not None:
+            # Mid-drag: only repaint the lines
+            self.canvas.restore_region(self._background)
+            for line in self._marker_lines:
+                self.ax.draw_artist(line)
+            self.canvas.blit(self.ax.bbox)
+        else:
+            self.canvas.draw_idle()
 
 
 class GamutViewer2D:
@@ -921,16 +1190,32 @@ class GamutViewer2D:
             [[[0, 0, 0]]], aspect="equal", extent=ap_lim + bp_lim, origin="lower"
         )
 
+        # Dragging the highlight point can fire many times per frame, but
+        # the model's trigger merges those, so the slice is only recomputed
+        # for the latest position.
         self.highlight_point_model.trigger.add_callback(self._refresh)
 
+    def disconnect(self):
+        self.highlight_point_model.trigger.remove_callback(self._refresh)
+
     def _refresh(self):
         Jp, _, _ = self.highlight_point_model.get_Jpapbp()
         low, high = self.bgcolor_ranges[self.bg]
         if not (low <= Jp <= high):
             self.bg = self.bg_opposites[self.bg]
             self.ax.set_facecolor(self.bgcolors[self.bg])
-        sRGB = sRGB_gamut_Jp_slice(Jp, self.uniform_space, self.ap_lim, self.bp_lim)
+        # Snap J' to half units so dragging back and forth reuses slices.
+        Jp = round(Jp * 2) / 2
+        try:
+            space_key = _space_key(self.uniform_space)
+        except TypeError:
+            sRGB = sRGB_gamut_Jp_slice(Jp, self.uniform_space, self.ap_lim, self.bp_lim)
+        else:
+            sRGB = _cached_Jp_slice(
+                Jp, space_key, tuple(self.ap_lim), tuple(self.bp_lim)
+            )
         self.image.set_data(sRGB)
+        self.ax.figure.canvas.draw_idle()
 
 
 class HighlightPoint2DView:
@@ -943,10 +1228,13 @@ class HighlightPoint2DView:
 
         self.highlight_point_model.trigger.add_callback(self._refresh)
 
+    def disconnect(self):
+        self.highlight_point_model.trigger.remove_callback(self._refresh)
+
     def _refresh(self):
         _, ap, bp = self.highlight_point_model.get_Jpapbp()
         self.marker.set_data([ap], [bp])
-        self.ax.figure.canvas.draw()
+        self.ax.figure.canvas.draw_idle()
 
 
 def loadpyfile(path):
@@ -975,8 +1263,53 @@ def loadpyfile(path):
     return params, cmtype, cmap.name, cmap, is_native, method
 
 
+def _literal_parameters(source):
+    """Find the `parameters = {...}` dict in a colormap .py file's source.
+
+    Returns None if the file doesn't assign it as a plain literal, or changes
+    it afterwards; then only running the file can tell what it ends up as.
+    """
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        return None
+    parameters = None
+    for node in tree.body:
+        if not any(
+            isinstance(n, ast.Name) and n.id == "parameters" for n in ast.walk(node)
+        ):
+            continue
+        if (
+            isinstance(node, ast.Assign)
+            and len(node.targets) == 1
+            and isinstance(node.targets[0], ast.Name)
+            and node.targets[0].id == "parameters"
+        ):
+            try:
+                parameters = ast.literal_eval(node.value)
+            except (ValueError, TypeError, SyntaxError, RecursionError):
+                return None
+        else:
+            # Touched some other way, e.g. parameters.update(...)
+            return None
+    if not isinstance(parameters, dict):
+        return None
+    return parameters
+
+
+# Keyed on the source itself, which is already in memory, so reloading an
+# unchanged file (e.g. going back and forth between the viewer and the
+# editor) skips the compile, and an edited file is never served stale code.
+@functools.lru_cache(maxsize=16)
+def _compile_pyfile(path, source):
+    return compile(source, os.path.basename(path), "exec")
+
+
 class Colormap:
     def __init__(self, cmtype, method, uniform_space):
+        # (path, source) of a .py colormap whose parameters were read without
+        # running it; it's only run once cmap or name is actually needed.
+        self._unexecuted_pyfile = None
         self.can_edit = True
         self.params = {}
         self.cmtype = cmtype
@@ -987,40 +1320,76 @@ class Colormap:
         if self.uniform_space == "buggy-CAM02-UCS":
             self.uniform_space = buggy_CAM02UCS
 
+    @property
+    def cmap(self):
+        self._exec_unexecuted_source()
+        return self._cmap
+
+    @cmap.setter
+    def cmap(self, cmap):
+        # An explicitly set colormap wins over a .py file still waiting to run
+        self._unexecuted_pyfile = None
+        self._cmap = cmap
+
+    @property
+    def name(self):
+        self._exec_unexecuted_source()
+        return self._name
+
+    @name.setter
+    def name(self, name):
+        self._unexecuted_pyfile = None
+        self._name = name
+
+    def _exec_pyfile(self, path, source):
+        ns = {
+            "__name__": "",
+            "__file__": os.path.basename(path),
+        }
+        code = _compile_pyfile(os.path.abspath(path), source)
+        exec(code, globals(), ns)
+        self._cmap = ns.get("test_cm", None)
+        self._name = self._cmap.name
+        return ns
+
+    def _exec_unexecuted_source(self):
+        if self._unexecuted_pyfile is not None:
+            path, source = self._unexecuted_pyfile
+            self._unexecuted_pyfile = None
+            self._exec_pyfile(path, source)
+
     def load(self, path):
         self.path = path
+        self._unexecuted_pyfile = None
         if os.path.isfile(path):
             _, extension = os.path.splitext(path)
             if extension == ".py":
                 self.can_edit = True
                 self.cmtype = "linear"
                 self.method = "Bezier"
-                ns = {
-                    "__name__": "",
-                    "__file__": os.path.basename(self.path),
-                }
                 with open(self.path) as f:
-                    code = compile(f.read(), os.path.basename(self.path), "exec")
-                    exec(code, globals(), ns)
-                self.params = ns.get("parameters", {})
+                    source = f.read()
+                # Editing only needs the parameters, which are usually a plain
+                # literal; running the whole file can wait until test_cm is
+                # wanted.
+                self.params = _literal_parameters(source)
+                if self.params is None:
+                    ns = self._exec_pyfile(self.path, source)
+                    self.params = ns.get("parameters", {})
+                else:
+                    self._unexecuted_pyfile = (self.path, source)
                 if not self.params:
                     self.can_edit = False
                 if "min_JK" in self.params:
                     self.params["min_Jp"] = self.params.pop("min_JK")
                     self.params["max_Jp"] = self.params.pop("max_JK")
-                self.cmap = ns.get("test_cm", None)
-                self.name = self.cmap.name
             elif extension == ".jscm":
                 self.can_edit = False
                 with open(self.path) as f:
                     data = json.loads(f.read())
                     self.name = data["name"]
-                    colors = data["colors"]
-                    colors = [colors[i : i + 6] for i in range(0, len(colors), 6)]
-                    colors = [
-                        [int(c[2 * i : 2 * i + 2], 16) / 255 for i in range(3)]
-                        for c in colors
-                    ]
+                    colors = np.frombuffer(bytes.fromhex(data["colors"]), np.uint8)
+                    colors = colors.reshape((-1, 3)) / 255
                     self.cmap = matplotlib.colors.ListedColormap(colors, self.name)
                     if (
                         "extensions" in data
@@ -1104,7 +1473,7 @@ class ViewerWindow(QtWidgets.QMainWindow):
 
     def toggle_gamut(self):
         self.viscm.toggle_gamut()
-        self.figurecanvas.draw()
+        self.figurecanvas.draw_idle()
 
     def fileQuit(self):
         self.close()
@@ -1264,8 +1633,14 @@ class EditorWindow(QtWidgets.QMainWindow):
 
     def swapjp(self):
         jp1, jp2 = self.min_slider.value(), self.max_slider.value()
+        # Each slider change would update the colormap; set both quietly and
+        # recompute once
+        self.min_slider.blockSignals(True)
+        self.max_slider.blockSignals(True)
         self.min_slider.setValue(int(jp2))
         self.max_slider.setValue(int(jp1))
+        self.min_slider.blockSignals(False)
+        self.max_slider.blockSignals(False)
         self.updatejp()
 
     def updatejp(self):
@@ -1304,6 +1679,13 @@ class EditorWindow(QtWidgets.QMainWindow):
         self.close()
 
     def closeEvent(self, ce):
+        # Stop model updates and canvas events from doing any more work on a
+        # figure that's going away
+        if self.viscm_editor.cmtype == "diverging":
+            self.viscm_editor.cmap_model.filter_k_trigger.remove_callback(
+                self.update_smoothness_slider
+            )
+        self.viscm_editor.disconnect()
         self.fileQuit()
 
     def save(self):
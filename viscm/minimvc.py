@@ -3,13 +3,51 @@
 # Copyright (C) 2015 Stefan van der Walt <stefanv@berkeley.edu>
 # See file LICENSE.txt for license information.
 
+import inspect
+import weakref
+
+
+class _StrongRef:
+    """Stands in for a weakref to a callback we do want to keep alive."""
+
+    __slots__ = ("_f",)
+
+    def __init__(self, f):
+        self._f = f
+
+    def __call__(self):
+        return self._f
+
+    def __eq__(self, other):
+        return isinstance(other, _StrongRef) and self._f == other._f
+
+    def __hash__(self):
+        return hash(self._f)
+
 
 class Trigger:
-    def __init__(self):
+    def __init__(self, schedule=None):
+        """If given, schedule(f) should arrange for f to be called later, e.g.
+        on the next pass through a GUI event loop. Callbacks then run from
+        there, once, however many times fire() was called in the meantime.
+        """
         self._callbacks = set()
+        self._schedule = schedule
+        self._scheduled = False
+        # Bumped on every fire(), so observers can tell whether anything
+        # changed since they last looked.
+        self.version = 0
+
+    def _ref(self, f):
+        # Bound methods are only held weakly, so a view that's gone away
+        # drops out of the set instead of being kept alive by its model.
+        # Plain functions and lambdas often have no other owner, so keep them.
+        if inspect.ismethod(f):
+            return weakref.WeakMethod(f, self._callbacks.discard)
+        return _StrongRef(f)
 
     def add_callback(self, f):
-        self._callbacks.add(f)
+        self._callbacks.add(self._ref(f))
         # Always call it immediately -- this is always legal (b/c as soon as
         # you call add_callback you have to be prepared for changes to
         # happen), saves having to explicitly call refresh methods in every
@@ -17,8 +55,24 @@ class Trigger:
         f()
 
     def remove_callback(self, f):
-        self._callbacks.remove(f)
+        self._callbacks.remove(self._ref(f))
 
     def fire(self):
-        for f in self._callbacks:
-            f()
+        self.version += 1
+        if self._schedule is None:
+            self._call_callbacks()
+        elif not self._scheduled:
+            self._scheduled = True
+            self._schedule(self._call_scheduled)
+
+    def _call_scheduled(self):
+        self._scheduled = False
+        self._call_callbacks()
+
+    def _call_callbacks(self):
+        # Copy first: a callback may add or remove callbacks, and dead
+        # methods remove themselves
+        for ref in list(self._callbacks):
+            f = ref()
+            if f is not None:
+                f()